@@ -83,6 +83,7 @@ def get_setup_kwargs(raw=False):
             install_requires=requirements,
             extras_require={
                 'json': 'ujson',
+                'orjson': 'orjson',
                 'socks': 'PySocks',
                 # 3.4-3.4.3 contained some cyclical import bugs
                 'passport': 'cryptography!=3.4,!=3.4.1,!=3.4.2,!=3.4.3',
@@ -105,6 +106,10 @@ def get_setup_kwargs(raw=False):
             python_requires='>=3.7'
         )
 
+    # The re2 engine is only used by telegram.ext, which is not part of the raw package
+    if not raw:
+        kwargs['extras_require']['re2'] = 'google-re2'
+
     return kwargs
 
 
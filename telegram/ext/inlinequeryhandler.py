@@ -18,8 +18,10 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the InlineQueryHandler class."""
 import re
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Match,
     Optional,
@@ -28,8 +30,17 @@ from typing import (
     Union,
     cast,
     List,
+    FrozenSet,
 )
 
+try:
+    import re2
+
+    RE2_INSTALLED = True
+except ImportError:
+    re2 = None
+    RE2_INSTALLED = False
+
 from telegram import Update
 from telegram.utils.defaultvalue import DefaultValue, DEFAULT_FALSE
 
@@ -42,6 +53,17 @@ if TYPE_CHECKING:
 RT = TypeVar('RT')
 
 
+@lru_cache(maxsize=2048)
+def _compile_pattern(pattern: str, flags: int, engine: str) -> Any:
+    """Compiles ``pattern``, sharing the result between handlers using the same pattern.
+    Returns a :obj:`Pattern` for ``engine='re'`` and an RE2 pattern object for ``engine='re2'``.
+    ``flags`` are only supported for ``engine='re'``.
+    """
+    if engine == 're2':
+        return re2.compile(pattern)
+    return re.compile(pattern, flags)
+
+
 class InlineQueryHandler(Handler[Update, CCT]):
     """
     Handler class to handle Telegram inline queries. Optionally based on a regex. Read the
@@ -61,28 +83,58 @@ class InlineQueryHandler(Handler[Update, CCT]):
 
             The return value of the callback is usually ignored except for the special case of
             :class:`telegram.ext.ConversationHandler`.
-        pattern (:obj:`str` | :obj:`Pattern`, optional): Regex pattern. If not :obj:`None`,
-            ``re.match`` is used on :attr:`telegram.InlineQuery.query` to determine if an update
-            should be handled by this handler.
+        pattern (:obj:`str` | :obj:`Pattern`, optional): Regex pattern. If not :obj:`None`, the
+            ``match`` method of the compiled pattern is used on
+            :attr:`telegram.InlineQuery.query` (bounded by :attr:`match_max_len`, if passed) to
+            determine if an update should be handled by this handler.
         chat_types (List[:obj:`str`], optional): List of allowed chat types. If passed, will only
             handle inline queries with the appropriate :attr:`telegram.InlineQuery.chat_type`.
 
             .. versionadded:: 13.5
         run_async (:obj:`bool`): Determines whether the callback will run asynchronously.
             Defaults to :obj:`False`.
+        match_max_len (:obj:`int`, optional): If passed, :attr:`pattern` is only matched against
+            the first ``match_max_len`` characters of :attr:`telegram.InlineQuery.query`. Useful
+            for patterns that only need to inspect a short prefix of the query. Note that ``$``
+            will match at this position.
+
+            .. versionadded:: 14.0
+        ascii_mode (:obj:`bool`, optional): If :obj:`True` and :attr:`pattern` is passed as
+            :obj:`str`, it is compiled with ``re.ASCII``, i.e. ``\\w``, ``\\d``, ``\\s`` etc.
+            only match ASCII characters. This makes matching faster and is recommended for
+            patterns like ``/command arg1 arg2``. Ignored if ``engine`` is ``'re2'``. Defaults
+            to :obj:`False`.
+
+            .. versionadded:: 14.0
+        engine (:obj:`str`, optional): The regex engine used to compile :attr:`pattern`, if it
+            is passed as :obj:`str`. Either ``'re'`` for Pythons ``re`` module or ``'re2'`` for
+            `google-re2 <https://pypi.org/project/google-re2/>`_. RE2 guarantees matching in
+            linear time, which protects against catastrophic backtracking on user provided
+            queries, but doesn't support features like backreferences or lookarounds. Note that
+            with RE2, ``\\w``, ``\\d`` and ``\\s`` only match ASCII characters, so patterns
+            may match differently than with ``re``. Requires PTB to be installed via
+            ``pip install python-telegram-bot[re2]``. Defaults to ``'re'``.
+
+            .. versionadded:: 14.0
 
     Attributes:
         callback (:obj:`callable`): The callback function for this handler.
         pattern (:obj:`str` | :obj:`Pattern`): Optional. Regex pattern to test
             :attr:`telegram.InlineQuery.query` against.
-        chat_types (List[:obj:`str`], optional): List of allowed chat types.
+        chat_types (FrozenSet[:obj:`str`], optional): Set of allowed chat types.
 
             .. versionadded:: 13.5
+            .. versionchanged:: 14.0
+                Stored as :obj:`frozenset` instead of :obj:`list`.
         run_async (:obj:`bool`): Determines whether the callback will run asynchronously.
+        match_max_len (:obj:`int`): Optional. Number of characters of the query that
+            :attr:`pattern` is matched against.
+
+            .. versionadded:: 14.0
 
     """
 
-    __slots__ = ('pattern', 'chat_types')
+    __slots__ = ('pattern', 'chat_types', 'match_max_len', '_flags', '_engine')
 
     def __init__(
         self,
@@ -90,17 +142,33 @@ class InlineQueryHandler(Handler[Update, CCT]):
         pattern: Union[str, Pattern] = None,
         run_async: Union[bool, DefaultValue] = DEFAULT_FALSE,
         chat_types: List[str] = None,
+        match_max_len: int = None,
+        ascii_mode: bool = False,
+        engine: str = 're',
     ):
         super().__init__(
             callback,
             run_async=run_async,
         )
 
+        if engine not in ('re', 're2'):
+            raise ValueError(f"engine must be either 're' or 're2', got {engine!r}")
+        if engine == 're2' and not RE2_INSTALLED:
+            raise RuntimeError(
+                'To use the re2 engine, PTB must be installed via `pip install '
+                'python-telegram-bot[re2]`.'
+            )
+
+        self._engine = engine
+        self._flags = re.ASCII if ascii_mode and engine == 're' else 0
         if isinstance(pattern, str):
-            pattern = re.compile(pattern)
+            pattern = _compile_pattern(pattern, self._flags, self._engine)
 
-        self.pattern = pattern
-        self.chat_types = chat_types
+        self.pattern: Optional[Union[str, Pattern]] = pattern
+        self.chat_types: Optional[FrozenSet[str]] = (
+            frozenset(chat_types) if chat_types is not None else None
+        )
+        self.match_max_len = match_max_len
 
     def check_update(self, update: object) -> Optional[Union[bool, Match]]:
         """
@@ -113,19 +181,25 @@ class InlineQueryHandler(Handler[Update, CCT]):
             :obj:`bool`
 
         """
-        if isinstance(update, Update) and update.inline_query:
-            if (self.chat_types is not None) and (
-                update.inline_query.chat_type not in self.chat_types
-            ):
-                return False
-            if self.pattern:
-                if update.inline_query.query:
-                    match = re.match(self.pattern, update.inline_query.query)
-                    if match:
-                        return match
-            else:
-                return True
-        return None
+        if not isinstance(update, Update):
+            return None
+        inline_query = update.inline_query
+        if inline_query is None:
+            return None
+        if (self.chat_types is not None) and (inline_query.chat_type not in self.chat_types):
+            return False
+        pattern = self.pattern
+        if pattern is None:
+            return True
+        if isinstance(pattern, str):
+            # pattern may have been set as string after the handler was created
+            pattern = _compile_pattern(pattern, self._flags, self._engine)
+        query = inline_query.query
+        if not query:
+            return None
+        if self.match_max_len is None:
+            return pattern.match(query)
+        return pattern.match(query, 0, self.match_max_len)
 
     def collect_additional_context(
         self,
@@ -134,9 +208,9 @@ class InlineQueryHandler(Handler[Update, CCT]):
         dispatcher: 'Dispatcher',
         check_result: Optional[Union[bool, Match]],
     ) -> None:
-        """Add the result of ``re.match(pattern, update.inline_query.query)`` to
-        :attr:`CallbackContext.matches` as list with one element.
+        """Add the match result of :attr:`pattern` to :attr:`CallbackContext.matches` as list with
+        one element.
         """
-        if self.pattern:
+        if self.pattern is not None:
             check_result = cast(Match, check_result)
             context.matches = [check_result]
@@ -88,9 +88,12 @@ class StringCommandHandler(Handler[str, CCT]):
 
         """
         if isinstance(update, str) and update.startswith('/'):
-            args = update[1:].split(' ')
-            if args[0] == self.command:
-                return args[1:]
+            # Only split the arguments once the command itself is confirmed
+            end = update.find(' ')
+            if end == -1:
+                end = len(update)
+            if end == len(self.command) + 1 and update.startswith(self.command, 1):
+                return update[end + 1 :].split(' ') if end < len(update) else []
         return None
 
     def collect_additional_context(
@@ -30,6 +30,14 @@ try:
 except ImportError:
     import json  # type: ignore[no-redef]
 
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_INSTALLED = False
+
 from typing import Any, Union
 
 import certifi
@@ -210,11 +218,20 @@ class Request:
             dict: A JSON parsed as Python dict with results - on error this dict will be empty.
 
         """
-        decoded_s = json_data.decode('utf-8', 'replace')
-        try:
-            data = json.loads(decoded_s)
-        except ValueError as exc:
-            raise TelegramError('Invalid server response') from exc
+        data = None
+        if ORJSON_INSTALLED:
+            try:
+                data = orjson.loads(json_data)
+            except ValueError:
+                # orjson is stricter than json, e.g. regarding invalid utf-8 and lone surrogates
+                pass
+
+        if data is None:
+            decoded_s = json_data.decode('utf-8', 'replace')
+            try:
+                data = json.loads(decoded_s)
+            except ValueError as exc:
+                raise TelegramError('Invalid server response') from exc
 
         if not data.get('ok'):  # pragma: no cover
             description = data.get('description')
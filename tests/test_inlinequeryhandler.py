@@ -16,6 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import re
 from queue import Queue
 
 import pytest
@@ -113,6 +114,49 @@ class TestInlineQueryHandler:
         if context.matches[0].groupdict():
             self.test_flag = context.matches[0].groupdict() == {'begin': 't', 'end': ' query'}
 
+    def test_pattern_shared(self):
+        handler_1 = InlineQueryHandler(self.callback_context, pattern=r'shared (.*)')
+        # make sure that the pattern isn't just taken from the cache of the re module
+        re.purge()
+        handler_2 = InlineQueryHandler(self.callback_context, pattern=r'shared (.*)')
+        assert handler_1.pattern is handler_2.pattern
+
+    @pytest.mark.parametrize('ascii_mode,result', [(True, False), (False, True)])
+    def test_ascii_mode(self, inline_query, ascii_mode, result):
+        inline_query.inline_query.query = 'tëst query'
+        handler = InlineQueryHandler(
+            self.callback_context, pattern=r'\w+ query', ascii_mode=ascii_mode
+        )
+        assert bool(handler.check_update(inline_query)) is result
+
+    def test_pattern_set_as_string(self, inline_query):
+        handler = InlineQueryHandler(self.callback_context, pattern='other')
+        assert not handler.check_update(inline_query)
+        handler.pattern = r'(t)est(.*)'
+        assert handler.check_update(inline_query).groups() == ('t', ' query')
+
+    def test_pattern_set_as_string_keeps_options(self, inline_query):
+        inline_query.inline_query.query = 'tëst'
+        handler = InlineQueryHandler(self.callback_context, pattern='other', ascii_mode=True)
+        handler.pattern = r'\w+$'
+        assert not handler.check_update(inline_query)
+
+    def test_invalid_engine(self):
+        with pytest.raises(ValueError, match="'re' or 're2'"):
+            InlineQueryHandler(self.callback_context, pattern='test', engine='regex')
+
+    def test_re2_engine(self, inline_query):
+        pytest.importorskip('re2')
+        handler = InlineQueryHandler(
+            self.callback_context, pattern=r'(t)est(.*)', engine='re2', match_max_len=6
+        )
+        assert handler.check_update(inline_query).groups() == ('t', ' q')
+
+    def test_re2_not_installed(self, monkeypatch):
+        monkeypatch.setattr('telegram.ext.inlinequeryhandler.RE2_INSTALLED', False)
+        with pytest.raises(RuntimeError, match=r'python-telegram-bot\[re2\]'):
+            InlineQueryHandler(self.callback_context, pattern='test', engine='re2')
+
     def test_other_update_types(self, false_update):
         handler = InlineQueryHandler(self.callback_context)
         assert not handler.check_update(false_update)
@@ -140,6 +184,22 @@ class TestInlineQueryHandler:
         dp.process_update(inline_query)
         assert self.test_flag
 
+    @pytest.mark.parametrize(
+        'pattern,match_max_len,result',
+        [
+            (r'test', 4, True),
+            (r'test query', 4, False),
+            (r'test$', 4, True),
+            (r'test$', None, False),
+            (r'test query', None, True),
+        ],
+    )
+    def test_match_max_len(self, inline_query, pattern, match_max_len, result):
+        handler = InlineQueryHandler(
+            self.callback_context, pattern=pattern, match_max_len=match_max_len
+        )
+        assert bool(handler.check_update(inline_query)) is result
+
     @pytest.mark.parametrize('chat_types', [[Chat.SENDER], [Chat.SENDER, Chat.SUPERGROUP], []])
     @pytest.mark.parametrize(
         'chat_type,result', [(Chat.SENDER, True), (Chat.CHANNEL, False), (None, False)]
@@ -149,6 +209,7 @@ class TestInlineQueryHandler:
             inline_query.inline_query.chat_type = chat_type
 
             handler = InlineQueryHandler(self.callback_context, chat_types=chat_types)
+            assert handler.chat_types == frozenset(chat_types)
             dp.add_handler(handler)
             dp.process_update(inline_query)
 
@@ -18,6 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 import pytest
 
+import telegram.request
 from telegram.error import TelegramError
 from telegram.request import Request
 
@@ -29,7 +30,39 @@ def test_slot_behaviour(mro_slots):
     assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
 
-def test_replaced_unprintable_char():
+@pytest.fixture(params=[True, False], ids=['orjson', 'json'])
+def orjson_installed(request, monkeypatch):
+    if request.param:
+        pytest.importorskip('orjson')
+    monkeypatch.setattr('telegram.request.ORJSON_INSTALLED', request.param)
+    return request.param
+
+
+def test_parse_orjson(monkeypatch, orjson_installed):
+    called = []
+    if orjson_installed:
+        orig_loads = telegram.request.orjson.loads
+
+        def loads(data):
+            called.append(data)
+            return orig_loads(data)
+
+        monkeypatch.setattr(telegram.request.orjson, 'loads', loads)
+
+    assert Request._parse(b'{"ok": true, "result": "KUKU"}') == 'KUKU'
+    assert bool(called) is orjson_installed
+
+
+def test_parse_lone_surrogate(orjson_installed):
+    """
+    orjson rejects lone surrogates, which json accepts. Make sure we fall back to json.
+    """
+    server_response = b'{"ok": true, "result": "\\ud83d x"}'
+
+    assert Request._parse(server_response) == '\ud83d x'
+
+
+def test_replaced_unprintable_char(orjson_installed):
     """
     Clients can send arbitrary bytes in callback data.
     Make sure the correct error is raised in this case.
@@ -39,7 +72,7 @@ def test_replaced_unprintable_char():
     assert Request._parse(server_response) == 'KUKU'
 
 
-def test_parse_illegal_json():
+def test_parse_illegal_json(orjson_installed):
     """
     Clients can send arbitrary bytes in callback data.
     Make sure the correct error is raised in this case.
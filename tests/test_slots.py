@@ -52,6 +52,10 @@ def test_class_has_slots_and_no_dict():
                 continue
 
             assert '__slots__' in cls.__dict__, f"class '{name}' in {path} doesn't have __slots__"
+            for base in cls.__mro__[1:-1]:
+                if base.__module__ == 'builtins':  # e.g. Exception doesn't have __slots__
+                    continue
+                assert '__slots__' in base.__dict__, f"base {base!r} of {name!r} has no __slots__"
             # if the class slots is a string, then mro_slots() iterates through that string (bad).
             assert not isinstance(cls.__slots__, str), f"{name!r}s slots shouldn't be strings"
 
@@ -96,6 +96,23 @@ class TestStringCommandHandler:
     def callback_context_args(self, update, context):
         self.test_flag = context.args == ['one', 'two']
 
+    @pytest.mark.parametrize(
+        'update,result',
+        [
+            ('/test', []),
+            ('/test one two', ['one', 'two']),
+            ('/test ', ['']),
+            ('/test  one', ['', 'one']),
+            ('/testing one', None),
+            ('/tes', None),
+            ('test', None),
+            ('/other test', None),
+        ],
+    )
+    def test_check_update(self, update, result):
+        handler = StringCommandHandler('test', self.callback_context)
+        assert handler.check_update(update) == result
+
     def test_other_update_types(self, false_update):
         handler = StringCommandHandler('test', self.callback_context)
         assert not handler.check_update(false_update)
@@ -63,9 +63,12 @@ ids = (
 )
 
 
-@pytest.fixture(scope='class', params=params, ids=ids)
+false_updates = [Update(update_id=1, **param) for param in params]
+
+
+@pytest.fixture(scope='session', params=false_updates, ids=ids)
 def false_update(request):
-    return Update(update_id=1, **request.param)
+    return request.param
 
 
 class TestStringRegexHandler: